@@ -1,4 +1,7 @@
 """Authentication for salesforce-reporting"""
+import collections
+import threading
+
 import requests
 import xml.dom.minidom
 
@@ -9,6 +12,9 @@ except ImportError:
     from cgi import escape
 
 
+_Session = collections.namedtuple('_Session', ['token', 'instance'])
+
+
 class Connection:
     """
     A Salesforce connection for accessing the Salesforce Analytics API using
@@ -31,6 +37,11 @@ class Connection:
         whether or not the Salesforce instance connected to is a Sandbox
     api_version: string
 
+    A single Connection can be shared between threads. The session token and
+    instance are held as one immutable snapshot which is only replaced, under a
+    lock, when Salesforce rejects an expired session; every request builds its
+    own headers and payload.
+
     """
 
     def __init__(self, username=None, password=None, security_token=None, sandbox=False, api_version='v29.0'):
@@ -39,11 +50,29 @@ class Connection:
         self.security_token = security_token
         self.sandbox = sandbox
         self.api_version = api_version
-        self.login_details = self.login(self.username, self.password, self.security_token)
-        self.token = self.login_details['oauth']
-        self.instance = self.login_details['instance']
-        self.headers = {'Authorization': 'OAuth {}'.format(self.token)}
-        self.base_url = 'https://{}/services/data/v31.0/analytics'.format(self.instance)
+        self._session_lock = threading.Lock()
+        self._session = self._new_session()
+
+    @property
+    def login_details(self):
+        session = self._session
+        return {'oauth': session.token, 'instance': session.instance}
+
+    @property
+    def token(self):
+        return self._session.token
+
+    @property
+    def instance(self):
+        return self._session.instance
+
+    @property
+    def headers(self):
+        return self._get_headers(self._session.token)
+
+    @property
+    def base_url(self):
+        return self._get_base_url(self._session.instance)
 
     @staticmethod
     def element_from_xml_string(xml_string, element):
@@ -64,6 +93,14 @@ class Connection:
         else:
             return 'https://{}.salesforce.com/services/Soap/u/{}'.format('login', api_version)
 
+    @staticmethod
+    def _get_base_url(instance):
+        return 'https://{}/services/data/v31.0/analytics'.format(instance)
+
+    @staticmethod
+    def _get_headers(token):
+        return {'Authorization': 'OAuth {}'.format(token)}
+
     def login(self, username, password, security_token):
         username = escape(username)
         password = escape(password)
@@ -108,19 +145,43 @@ class Connection:
 
         return {'oauth': oauth_token, 'instance': instance}
 
-    def _get_metadata(self, url):
-        return requests.get(url + '/describe', headers=self.headers).json()
+    def _new_session(self):
+        login_details = self.login(self.username, self.password, self.security_token)
+        return _Session(login_details['oauth'], login_details['instance'])
+
+    def _refresh_session(self, expired):
+        with self._session_lock:
+            # Another thread may have logged in again while we waited
+            if self._session is expired:
+                self._session = self._new_session()
+            return self._session
+
+    def _request(self, method, path, **kwargs):
+        session = self._session
+        response = requests.request(method, self._get_base_url(session.instance) + path,
+                                    headers=self._get_headers(session.token), **kwargs)
+
+        if response.status_code == 401:
+            session = self._refresh_session(session)
+            response = requests.request(method, self._get_base_url(session.instance) + path,
+                                        headers=self._get_headers(session.token), **kwargs)
+
+        return response.json()
+
+    def _get_metadata(self, path):
+        return self._request('GET', path + '/describe')
 
-    def _get_report_filtered(self, url, filters):
-        metadata_url = url.split('?')[0]
-        metadata = self._get_metadata(metadata_url)
-        for report_filter in filters:
-            metadata["reportMetadata"]["reportFilters"].append(report_filter)
+    def _get_report_filtered(self, path, filters):
+        metadata_path = path.split('?')[0]
+        metadata = self._get_metadata(metadata_path)
+        report_metadata = dict(metadata["reportMetadata"])
+        report_metadata["reportFilters"] = list(report_metadata["reportFilters"]) + list(filters)
+        payload = dict(metadata, reportMetadata=report_metadata)
 
-        return requests.post(url, headers=self.headers, json=metadata).json()
+        return self._request('POST', path, json=payload)
 
-    def _get_report_all(self, url):
-        return requests.post(url, headers=self.headers).json()
+    def _get_report_all(self, path):
+        return self._request('POST', path)
 
     def get_report(self, report_id, filters=None, details=True):
         """
@@ -139,16 +200,16 @@ class Connection:
         report: JSON
         """
         details = 'true' if details else 'false'
-        url = '{}/reports/{}?includeDetails={}'.format(self.base_url, report_id, details)
+        path = '/reports/{}?includeDetails={}'.format(report_id, details)
 
         if filters:
-            return self._get_report_filtered(url, filters)
+            return self._get_report_filtered(path, filters)
         else:
-            return self._get_report_all(url)
+            return self._get_report_all(path)
 
     def get_dashboard(self, dashboard_id):
-        url = '{}/dashboards/{}/'.format(self.base_url, dashboard_id)
-        return requests.get(url, headers=self.headers).json()
+        path = '/dashboards/{}/'.format(dashboard_id)
+        return self._request('GET', path)
 
 
 class AuthenticationFailure(Exception):
@@ -0,0 +1,174 @@
+import json
+import threading
+import unittest
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from salesforce_reporting import Connection
+
+LOGIN_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <loginResponse>
+            <result>
+                <serverUrl>http://{instance}/services/Soap/u/29.0</serverUrl>
+                <sessionId>{token}</sessionId>
+            </result>
+        </loginResponse>
+    </soapenv:Body>
+</soapenv:Envelope>"""
+
+BASE_FILTER = {'column': 'OWNER', 'operator': 'equals', 'value': 'Chris Hall'}
+
+
+class StubSalesforce(ThreadingMixIn, HTTPServer):
+    """Minimal Salesforce stand-in that issues and expires session tokens."""
+    daemon_threads = True
+    request_queue_size = 64
+
+    def __init__(self):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), StubHandler)
+        self.lock = threading.Lock()
+        self.logins = 0
+        self.token = None
+
+    @property
+    def instance(self):
+        return '127.0.0.1:{}'.format(self.server_address[1])
+
+    def login(self):
+        with self.lock:
+            self.logins += 1
+            self.token = 'token-{}'.format(self.logins)
+            return self.token
+
+    def expire_session(self):
+        with self.lock:
+            self.token = None
+
+    def is_authorized(self, header):
+        with self.lock:
+            return self.token is not None and header == 'OAuth {}'.format(self.token)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send(self, status, body, content_type='application/json'):
+        body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self._read_body()
+
+        if self.path == '/login':
+            token = self.server.login()
+            self._send(200, LOGIN_RESPONSE.format(instance=self.server.instance, token=token), 'text/xml')
+        elif not self.server.is_authorized(self.headers.get('Authorization')):
+            self._send(401, json.dumps([{'errorCode': 'INVALID_SESSION_ID'}]))
+        else:
+            report_id = self.path.split('/reports/')[1].split('?')[0]
+            payload = json.loads(body.decode('utf-8')) if body else {}
+            self._send(200, json.dumps({'reportId': report_id, 'request': payload}))
+
+    def do_GET(self):
+        if not self.server.is_authorized(self.headers.get('Authorization')):
+            self._send(401, json.dumps([{'errorCode': 'INVALID_SESSION_ID'}]))
+        else:
+            self._send(200, json.dumps({'reportMetadata': {'reportFilters': [BASE_FILTER]}}))
+
+
+class ConcurrentConnectionTest(unittest.TestCase):
+    workers = 32
+    requests_per_worker = 10
+
+    def setUp(self):
+        self.server = StubSalesforce()
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        login_url = 'http://{}/login'.format(self.server.instance)
+
+        class StubConnection(Connection):
+
+            def _get_login_url(self, is_sandbox, api_version):
+                return login_url
+
+            @staticmethod
+            def _get_base_url(instance):
+                return 'http://{}/services/data/v31.0/analytics'.format(instance)
+
+        self.connection = StubConnection(username='fake@user.com', password='1234', security_token='5678')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run_workers(self, task):
+        errors = []
+        start = threading.Barrier(self.workers)
+
+        def worker(n):
+            try:
+                start.wait()
+                task(n)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+    def test_filtered_reports_do_not_share_payloads(self):
+        results = {}
+
+        def task(n):
+            report_filter = {'column': 'ACCOUNT_ID', 'operator': 'equals', 'value': str(n)}
+            results[n] = [self.connection.get_report('00O{}'.format(n), filters=[report_filter])
+                          for _ in range(self.requests_per_worker)]
+
+        self.run_workers(task)
+
+        for n in range(self.workers):
+            expected_filters = [BASE_FILTER, {'column': 'ACCOUNT_ID', 'operator': 'equals', 'value': str(n)}]
+            for report in results[n]:
+                self.assertEqual(report['reportId'], '00O{}'.format(n))
+                self.assertEqual(report['request']['reportMetadata']['reportFilters'], expected_filters)
+
+        self.assertEqual(self.server.logins, 1)
+
+    def test_expired_session_is_refreshed_once(self):
+        halfway = threading.Barrier(self.workers, action=self.server.expire_session)
+        results = {}
+
+        def task(n):
+            reports = [self.connection.get_report('00O{}'.format(n)) for _ in range(self.requests_per_worker)]
+            halfway.wait()
+            reports += [self.connection.get_report('00O{}'.format(n)) for _ in range(self.requests_per_worker)]
+            results[n] = reports
+
+        self.run_workers(task)
+
+        for n in range(self.workers):
+            self.assertEqual(len(results[n]), 2 * self.requests_per_worker)
+            self.assertTrue(all(report['reportId'] == '00O{}'.format(n) for report in results[n]))
+
+        self.assertEqual(self.server.logins, 2)
+        self.assertEqual(self.connection.token, 'token-2')
+        self.assertEqual(self.connection.headers, {'Authorization': 'OAuth token-2'})